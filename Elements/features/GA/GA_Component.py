@@ -30,7 +30,6 @@ class GATransform(BasicTransform):
         self._rot = rot
         self._l2world = util.identity()
         self._l2cam = util.identity()
-        self._parent = self
         self._children = []
         # print("New component has been initialized")
 
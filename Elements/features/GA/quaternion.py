@@ -3,6 +3,12 @@ from numbers import Number
 import numpy as np
 import random
 
+try:
+  from numba import njit, prange
+  HAS_NUMBA = True
+except ImportError:
+  HAS_NUMBA = False
+
 
 class Quaternion(object):
   """ Hamiltonian quaternion denoted as q = [x y z w].T.
@@ -298,6 +304,167 @@ def quaternion_nlerp(q_1, q_2, fraction):
   return q
 
 
+def matrix_to_quat_batch(matrices):
+  """ Convert a batch of rotation matrices to quaternions at once.
+
+  Vectorized Shepperd-style conversion: for each matrix the numerically
+  largest quaternion component is used as the pivot, so the conversion is
+  stable for all rotations (unlike from_rotation_matrix, which divides by
+  w and degenerates near 180 degree rotations).
+
+  matrices is (N,3,3) or (N,4,4); returns (N,4) unit quaternions laid out
+  [x,y,z,w] like Quaternion.q.
+  """
+  R = np.asarray(matrices, dtype=np.float64)[:, :3, :3]
+  m00, m11, m22 = R[:, 0, 0], R[:, 1, 1], R[:, 2, 2]
+
+  #candidate magnitudes of the four components; clamped so sqrt stays real
+  qw = np.sqrt(np.maximum(0.0, 1.0 + m00 + m11 + m22)) / 2.0
+  qx = np.sqrt(np.maximum(0.0, 1.0 + m00 - m11 - m22)) / 2.0
+  qy = np.sqrt(np.maximum(0.0, 1.0 - m00 + m11 - m22)) / 2.0
+  qz = np.sqrt(np.maximum(0.0, 1.0 - m00 - m11 + m22)) / 2.0
+
+  #off-diagonal sums/differences fixing the remaining components' signs
+  dzy = R[:, 2, 1] - R[:, 1, 2]
+  dxz = R[:, 0, 2] - R[:, 2, 0]
+  dyx = R[:, 1, 0] - R[:, 0, 1]
+  sxy = R[:, 0, 1] + R[:, 1, 0]
+  sxz = R[:, 0, 2] + R[:, 2, 0]
+  syz = R[:, 1, 2] + R[:, 2, 1]
+
+  tiny = 1e-12
+  case = np.argmax(np.stack([qw, qx, qy, qz]), axis=0)
+  w4 = np.maximum(4.0 * qw, tiny)
+  x4 = np.maximum(4.0 * qx, tiny)
+  y4 = np.maximum(4.0 * qy, tiny)
+  z4 = np.maximum(4.0 * qz, tiny)
+
+  q = np.empty((len(R), 4))
+  q[:, 0] = np.choose(case, [dzy / w4, qx, sxy / y4, sxz / z4])
+  q[:, 1] = np.choose(case, [dxz / w4, sxy / x4, qy, syz / z4])
+  q[:, 2] = np.choose(case, [dyx / w4, sxz / x4, syz / y4, qz])
+  q[:, 3] = np.choose(case, [qw, dzy / x4, dxz / y4, dyx / z4])
+
+  return q / np.linalg.norm(q, axis=1, keepdims=True)
+
+
+def quat_to_mat_batch(quaternions):
+  """ Convert a batch of [x,y,z,w] quaternions to (N,3,3) rotation matrices.
+
+  Vectorized form of Quaternion.to_rotation_matrix.
+  """
+  q = np.asarray(quaternions, dtype=np.float64)
+  x, y, z, w = q[:, 0], q[:, 1], q[:, 2], q[:, 3]
+
+  R = np.empty((len(q), 3, 3))
+  R[:, 0, 0] = 1 - 2 * y**2 - 2 * z**2
+  R[:, 0, 1] = 2 * x * y - 2 * z * w
+  R[:, 0, 2] = 2 * x * z + 2 * y * w
+  R[:, 1, 0] = 2 * x * y + 2 * z * w
+  R[:, 1, 1] = 1 - 2 * x**2 - 2 * z**2
+  R[:, 1, 2] = 2 * y * z - 2 * x * w
+  R[:, 2, 0] = 2 * x * z - 2 * y * w
+  R[:, 2, 1] = 2 * y * z + 2 * x * w
+  R[:, 2, 2] = 1 - 2 * x**2 - 2 * y**2
+  return R
+
+
+def slerp_batch(q_1, q_2, fraction):
+  """ Spherical linear interpolation over whole (N,4) quaternion batches.
+
+  Vectorized form of quaternion_slerp operating on [x,y,z,w] component
+  arrays instead of Quaternion objects: one dot product, shortest-path
+  sign flip, and sin/cos weighting for all N pairs at once. Nearly
+  parallel pairs degrade to (normalized) lerp.
+  """
+  assert fraction >= 0.0 and fraction <= 1.0, "fraction should be in [0,1]."
+  q1 = np.array(q_1, dtype=np.float64) #copied: may be sign-flipped in place
+  q2 = np.asarray(q_2, dtype=np.float64)
+
+  dot_product = np.einsum('ij,ij->i', q1, q2)
+  q1[dot_product < 0.0] *= -1.0
+  dot_product = np.clip(np.abs(dot_product), -1.0, 1.0)
+
+  theta = np.arccos(dot_product) * fraction
+
+  q_3 = q2 - q1 * dot_product[:, None]
+  norm = np.linalg.norm(q_3, axis=1, keepdims=True)
+  q_3 = np.divide(q_3, norm, out=np.zeros_like(q_3), where=norm > 1e-12)
+
+  out = q1 * np.cos(theta)[:, None] + q_3 * np.sin(theta)[:, None]
+  return out / np.linalg.norm(out, axis=1, keepdims=True)
+
+
+if HAS_NUMBA:
+  @njit(cache=True, parallel=True, fastmath=True)
+  def _slerp_to_palette_kernel(q1, q2, t1, t2, fraction, out):
+    for i in prange(q1.shape[0]):
+      x1, y1, z1, w1 = q1[i, 0], q1[i, 1], q1[i, 2], q1[i, 3]
+      x2, y2, z2, w2 = q2[i, 0], q2[i, 1], q2[i, 2], q2[i, 3]
+      dot = x1 * x2 + y1 * y2 + z1 * z2 + w1 * w2
+      if dot < 0.0: #shortest-path sign flip, as in slerp_batch
+        x1, y1, z1, w1, dot = -x1, -y1, -z1, -w1, -dot
+      if dot > 1.0:
+        dot = 1.0
+      theta = np.arccos(dot) * fraction
+      ox = x2 - x1 * dot
+      oy = y2 - y1 * dot
+      oz = z2 - z1 * dot
+      ow = w2 - w1 * dot
+      nrm = np.sqrt(ox * ox + oy * oy + oz * oz + ow * ow)
+      if nrm > 1e-12:
+        ox, oy, oz, ow = ox / nrm, oy / nrm, oz / nrm, ow / nrm
+      else:
+        ox = oy = oz = ow = 0.0
+      c, s = np.cos(theta), np.sin(theta)
+      x = x1 * c + ox * s
+      y = y1 * c + oy * s
+      z = z1 * c + oz * s
+      w = w1 * c + ow * s
+      qn = np.sqrt(x * x + y * y + z * z + w * w)
+      x, y, z, w = x / qn, y / qn, z / qn, w / qn
+      #same formulas as quat_to_mat_batch, written straight into the palette
+      out[i, 0, 0] = 1 - 2 * y * y - 2 * z * z
+      out[i, 0, 1] = 2 * x * y - 2 * z * w
+      out[i, 0, 2] = 2 * x * z + 2 * y * w
+      out[i, 1, 0] = 2 * x * y + 2 * z * w
+      out[i, 1, 1] = 1 - 2 * x * x - 2 * z * z
+      out[i, 1, 2] = 2 * y * z - 2 * x * w
+      out[i, 2, 0] = 2 * x * z - 2 * y * w
+      out[i, 2, 1] = 2 * y * z + 2 * x * w
+      out[i, 2, 2] = 1 - 2 * x * x - 2 * y * y
+      for j in range(3):
+        out[i, j, 3] = t1[i, j] + fraction * (t2[i, j] - t1[i, j])
+
+  #compile once at import on a tiny batch, off the first animation frame
+  _warm = np.array([[0.0, 0.0, 0.0, 1.0]])
+  _slerp_to_palette_kernel(_warm, _warm, np.zeros((1, 3)), np.zeros((1, 3)),
+                           0.5, np.zeros((1, 4, 4)))
+  del _warm
+
+
+def slerp_to_palette(q_1, q_2, t_1, t_2, fraction, out):
+  """ Fill a preallocated (N,4,4) matrix palette from two keyframes.
+
+  Fuses slerp_batch and quat_to_mat_batch plus the translation lerp into
+  one pass that writes rotations into out[:,:3,:3] and translations into
+  out[:,:3,3] with no intermediate (N,4)/(N,3,3) arrays. Uses a numba
+  kernel when available and falls back to the batched numpy routines
+  otherwise. Rows 3 of out are left untouched (keep them at identity).
+  """
+  assert fraction >= 0.0 and fraction <= 1.0, "fraction should be in [0,1]."
+  if HAS_NUMBA:
+    q1 = np.ascontiguousarray(q_1, dtype=np.float64)
+    q2 = np.ascontiguousarray(q_2, dtype=np.float64)
+    t1 = np.ascontiguousarray(t_1, dtype=np.float64)
+    t2 = np.ascontiguousarray(t_2, dtype=np.float64)
+    _slerp_to_palette_kernel(q1, q2, t1, t2, float(fraction), out)
+  else:
+    out[:, :3, :3] = quat_to_mat_batch(slerp_batch(q_1, q_2, fraction))
+    out[:, :3, 3] = np.asarray(t_1) + fraction * (np.asarray(t_2) - np.asarray(t_1))
+  return out
+
+
 def quaternions_interpolate(q_left, t_left, q_right, t_right, times):
   """ Returns an array of the interpolated quaternions between q_left/t_left and
   q_right/t_right at times.
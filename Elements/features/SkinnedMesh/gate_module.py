@@ -4,6 +4,7 @@ warnings.filterwarnings('ignore')
 
 import numpy as np
 from numpy import e,pi
+from scipy import sparse
 from clifford.g3c import *
 from clifford.tools.g3c import *
 from pyassimp import *
@@ -72,6 +73,35 @@ def draw_original_wireframe():
     p.add_lines(v[f[:,2]], v[f[:,0]], shading={"line_color": "magenta"});
 
 
+def build_weight_matrix(vw, bone_count, vertex_count=None):
+  """
+  Build a sparse (V,N) vertex-to-bone weight matrix from a vertex_weight
+  table, dropping the -1 padding entries. Built once per mesh; feeds the
+  batched cpu_skin path below.
+  """
+  if vertex_count is None:
+    vertex_count = len(vw.weight)
+  rows = np.repeat(np.arange(vertex_count), vw.id.shape[1])
+  cols = vw.id[:vertex_count].ravel()
+  data = vw.weight[:vertex_count].ravel()
+  valid = cols >= 0
+  return sparse.csr_matrix((data[valid], (rows[valid], cols[valid])),
+                           shape=(vertex_count, bone_count))
+
+def cpu_skin(palette, v2, W):
+  """
+  Skin all vertices through an (N,4,4) matrix palette in one batched pass:
+  one (N,4,4)@(4,V) matmul transforms every vertex by every referenced
+  bone, then the sparse weight matrix blends the per-bone results. Batched
+  replacement for the per-vertex/per-weight Python loop around
+  vertex_apply_M; returns (V,3) skinned positions.
+  """
+  PV = palette @ v2.T  #(N,4,V): vertex i transformed by bone n
+  skinned = np.empty((v2.shape[0], 3))
+  for i in range(3):
+    skinned[:, i] = np.asarray(W.multiply(PV[:, i, :].T).sum(axis=1)).ravel()
+  return skinned
+
 def initialize_M(b):
   M = np.zeros([len(b),4,4])
   for i in range(len(b)):
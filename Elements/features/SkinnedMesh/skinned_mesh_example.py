@@ -221,6 +221,17 @@ model_terrain_axes = util.translate(0.0,0.0,0.0)
 trans4.trs = util.scale(0.1) @ util.translate(0.0,0.5,0.0)
 trans5.trs = util.scale(0.1) @ util.translate(0.0,0.5,0.0)
 
+#static light/material uniforms: set once before the loop; the stored
+#values persist on the shader component, so re-setting them per frame
+#only churned the uniform dicts with the same constants
+shaderDec4.setUniformVariable(key='ambientColor',value=Lambientcolor,float3=True)
+shaderDec4.setUniformVariable(key='ambientStr',value=Lambientstr,float1=True)
+shaderDec4.setUniformVariable(key='viewPos',value=LviewPos,float3=True)
+shaderDec4.setUniformVariable(key='lightPos',value=Lposition,float3=True)
+shaderDec4.setUniformVariable(key='lightColor',value=Lcolor,float3=True)
+shaderDec4.setUniformVariable(key='lightIntensity',value=Lintensity,float1=True)
+shaderDec4.setUniformVariable(key='shininess',value=Mshininess,float1=True)
+shaderDec4.setUniformVariable(key='matColor',value=Mcolor,float3=True)
 
 while running:
     running = scene.render()
@@ -229,23 +240,16 @@ while running:
     scene.world.traverse_visit(camUpdate, scene.world.root)
     view =  gWindow._myCamera # updates view via the imgui
     # mvp_cube = projMat @ view @ model_cube
-    mvp4 = projMat @ view @ trans4.trs
-    mvp_terrain = projMat @ view @ terrain_trans.trs
-    mvp_axes = projMat @ view @ axes_trans.trs
+    #one view-projection product per frame, then a single batched matmul
+    #over the stacked entity transforms instead of three chained products
+    vp = projMat @ view
+    mvp4, mvp_terrain, mvp_axes = vp @ np.stack((trans4.trs, terrain_trans.trs, axes_trans.trs))
     axes_shader.setUniformVariable(key='modelViewProj', value=mvp_axes, mat4=True)
     terrain_shader.setUniformVariable(key='modelViewProj', value=mvp_terrain, mat4=True)
     shaderDec5.setUniformVariable(key='modelViewProj', value=mvp4, mat4=True)
 
     shaderDec4.setUniformVariable(key='modelViewProj', value=mvp4, mat4=True)
     shaderDec4.setUniformVariable(key='model',value=trans4.trs,mat4=True)
-    shaderDec4.setUniformVariable(key='ambientColor',value=Lambientcolor,float3=True)
-    shaderDec4.setUniformVariable(key='ambientStr',value=Lambientstr,float1=True)
-    shaderDec4.setUniformVariable(key='viewPos',value=LviewPos,float3=True)
-    shaderDec4.setUniformVariable(key='lightPos',value=Lposition,float3=True)
-    shaderDec4.setUniformVariable(key='lightColor',value=Lcolor,float3=True)
-    shaderDec4.setUniformVariable(key='lightIntensity',value=Lintensity,float1=True)
-    shaderDec4.setUniformVariable(key='shininess',value=Mshininess,float1=True)
-    shaderDec4.setUniformVariable(key='matColor',value=Mcolor,float3=True)
 
 
     scene.render_post()
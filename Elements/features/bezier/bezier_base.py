@@ -1,9 +1,16 @@
 #### BEZIER 3D ####
 
+import functools
+
 import numpy as np
-import bezier
 import imgui
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 import Elements.pyECSS.math_utilities as util
 from Elements.pyECSS.Entity import Entity
 from Elements.pyECSS.Component import BasicTransform, RenderMesh
@@ -14,7 +21,7 @@ from Elements.pyGLV.GL.VertexArray import VertexArray
 from OpenGL.GL import GL_LINES, GL_POINTS, glPointSize
 
 
-input_bezier_control_nodes = [[0.0, 0.0, 0.0],[0.5, 0.2, 0.8],[-0.4, 1, -0.7]]
+input_bezier_control_nodes = np.array([[0.0, 0.0, 0.0], [0.5, 0.2, 0.8], [-0.4, 1, -0.7]], dtype=np.float32)
 input_render_detail = 100
 
 
@@ -36,6 +43,12 @@ class BezierCurve:
         self.all_shaders = all_shaders
         self.initUpdate = init_update
 
+        #reusable buffers for render details the tessellation cache does not cover
+        self.buffer_capacity = 0
+        self.vertex_buffer = None
+        self.color_buffer = None
+        self.index_buffer = None
+
     def render_gui_and_curve(self):
         """Function to display gui and trigger the rendering of the bezier curve.
         """
@@ -45,16 +58,18 @@ class BezierCurve:
         imgui.begin("Print Bezier Curve")
 
         imgui.text("Control nodes X, Y, Z")
-        for i, control_node in enumerate(input_bezier_control_nodes):
-            changed, input_bezier_control_nodes[i] = imgui.input_float3(f"Control Node {i + 1}", *control_node)
+        for i in range(len(input_bezier_control_nodes)):
+            changed, values = imgui.input_float3(f"Control Node {i + 1}", *input_bezier_control_nodes[i])
+            if changed:
+                input_bezier_control_nodes[i] = values
 
         button_remove_node_pressed = imgui.button("Remove Node")
         imgui.same_line()
         button_add_node_pressed = imgui.button("Add Node")
         if button_remove_node_pressed:
-            input_bezier_control_nodes.pop()
+            input_bezier_control_nodes = input_bezier_control_nodes[:-1]
         if button_add_node_pressed:
-            input_bezier_control_nodes.append([0.0, 0.0, 0.0])
+            input_bezier_control_nodes = np.vstack([input_bezier_control_nodes, np.zeros((1, 3), dtype=np.float32)])
 
         button_bezier_pressed = imgui.button("Print Bezier")
 
@@ -63,7 +78,6 @@ class BezierCurve:
             imgui.set_tooltip("Make sure the detail is between 4 to 100")
 
         if button_bezier_pressed:
-            input_bezier_control_nodes = [list(tuple) for tuple in input_bezier_control_nodes]
             self.render_curve(input_bezier_control_nodes, input_render_detail)
 
         imgui.end()
@@ -76,7 +90,8 @@ class BezierCurve:
             render_detail (Integer): Number of points to render on the bezier curve from user input
         """
 
-        bezier_vertices, bezier_colors, bezier_indices = generate_bezier_data(bezier_control_nodes, render_detail)
+        bezier_vertices, bezier_colors, bezier_indices = self.generate_bezier_data_reusing_buffers(
+            bezier_control_nodes, render_detail)
 
         ## ADD / UPDATE BEZIER ##
 
@@ -86,20 +101,20 @@ class BezierCurve:
                                                      BasicTransform(name="bezier_trans", trs=util.identity()))
         bezier_mesh = self.scene.world.addComponent(self.bezier_entity, RenderMesh(name="bezier_mesh"))
         bezier_mesh.vertex_attributes.append(bezier_vertices)
-        bezier_mesh.vertex_attributes.append(bezier_colors)
         bezier_mesh.vertex_index.append(bezier_indices)
         bezier_vArray = self.scene.world.addComponent(self.bezier_entity,
                                                       VertexArray(primitive=GL_LINES))  # note the primitive change
 
         bezier_shader = self.scene.world.addComponent(self.bezier_entity, ShaderGLDecorator(
-            Shader(vertex_source=Shader.COLOR_VERT_MVP, fragment_source=Shader.COLOR_FRAG)))
+            Shader(vertex_source=Shader.COLOR_VERT_MVP_UNIFORM, fragment_source=Shader.COLOR_FRAG)))
+        bezier_shader.setUniformVariable("u_color", bezier_colors[0], float4=True)
         self.all_shaders.append(bezier_shader)
 
         ## VISUALIZE BEZIER CONTROL NODES ##
 
         control_nodes_vertices = xyz_to_vertices(bezier_control_nodes)
-        control_nodes_colors = np.array([[0.5, 0.5, 1.0, 1.0]] * len(control_nodes_vertices), dtype=np.float32)
-        control_nodes_indices = np.array(range(len(control_nodes_vertices)), np.uint32)
+        control_nodes_colors = constant_colors([0.5, 0.5, 1.0, 1.0], len(control_nodes_vertices))
+        control_nodes_indices = np.arange(len(control_nodes_vertices), dtype=np.uint32)
 
         control_nodes = self.scene.world.createEntity(Entity(name="control_nodes"))
         self.scene.world.addEntityChild(self.bezier_entity, control_nodes)
@@ -108,21 +123,57 @@ class BezierCurve:
                                                                            trs=util.identity()))
         control_nodes_mesh = self.scene.world.addComponent(control_nodes, RenderMesh(name="control_nodes_mesh"))
         control_nodes_mesh.vertex_attributes.append(control_nodes_vertices)
-        control_nodes_mesh.vertex_attributes.append(control_nodes_colors)
         control_nodes_mesh.vertex_index.append(control_nodes_indices)
         glPointSize(5)
         control_nodes_vArray = self.scene.world.addComponent(control_nodes, VertexArray(primitive=GL_POINTS))
 
         control_nodes_shader = self.scene.world.addComponent(control_nodes, ShaderGLDecorator(
-            Shader(vertex_source=Shader.COLOR_VERT_MVP, fragment_source=Shader.COLOR_FRAG)))
+            Shader(vertex_source=Shader.COLOR_VERT_MVP_UNIFORM, fragment_source=Shader.COLOR_FRAG)))
+        control_nodes_shader.setUniformVariable("u_color", control_nodes_colors[0], float4=True)
         self.all_shaders.append(control_nodes_shader)
 
         self.scene.world.traverse_visit(self.initUpdate, self.scene.world.root)
 
+    def generate_bezier_data_reusing_buffers(self, bezier_control_nodes, num_points):
+        """Like generate_bezier_data, but writes into buffers owned by this instance.
+
+        Cached render details go through generate_bezier_data as usual;
+        for larger ones the vertex, color and index buffers are grown on
+        demand and reused across clicks instead of reallocating each time.
+
+        Args:
+            bezier_control_nodes (List): control nodes for the bezier curve from user input
+            num_points (Integer): Number of points to render on the bezier curve from user input
+
+        Returns:
+            List: Vertices (list), colors (list) and indices (list) for the bezier curve
+        """
+        if 4 <= num_points <= 100:
+            return generate_bezier_data(bezier_control_nodes, num_points)
+
+        num_vertices = 2 * num_points - 2
+        if num_vertices > self.buffer_capacity:
+            self.buffer_capacity = num_vertices
+            self.vertex_buffer = np.empty((num_vertices, 4), dtype=np.float32)
+            self.color_buffer = constant_colors([0.5, 0.0, 1.0, 1.0], num_vertices)
+            self.index_buffer = np.arange(num_vertices, dtype=np.uint32)
+
+        bezier_points = evaluate_bezier_points(bezier_control_nodes, num_points)
+
+        bezier_vertices = self.vertex_buffer[:num_vertices]
+        bezier_vertices[0::2, :3] = bezier_points[:-1]
+        bezier_vertices[1::2, :3] = bezier_points[1:]
+        bezier_vertices[:, 3] = 1.0
+
+        return bezier_vertices, self.color_buffer[:num_vertices], self.index_buffer[:num_vertices]
+
 
 def generate_bezier_data(bezier_control_nodes, num_points):
     """Compute bezier curve and generate vertices, colors and indices accordingly.
 
+    Repeated clicks with unchanged inputs are served from a small
+    tessellation cache instead of re-evaluating the curve.
+
     Args:
         bezier_control_nodes (List): control nodes for the bezier curve from user input
         render_detail (Integer): Number of points to render on the bezier curve from user input
@@ -130,64 +181,167 @@ def generate_bezier_data(bezier_control_nodes, num_points):
     Returns:
         List: Vertices (list), colors (list) and indices (list) for the bezier curve
     """
-    
-    bezier_curve = bezier.Curve.from_nodes(separate_coordinates(bezier_control_nodes))
-    print("created bezier curve:", bezier_curve)
+    nodes_key = tuple(tuple(node) for node in bezier_control_nodes)
 
-    x_values = np.linspace(0, 1, num_points)
-    bezier_points = bezier_curve.evaluate_multi(x_values)
-    bezier_points_xyz = combine_coordinates(bezier_points)
+    #only cache sane render details, as advertised by the gui tooltip
+    if 4 <= num_points <= 100:
+        return tessellate_bezier(nodes_key, num_points)
+    return tessellate_bezier.__wrapped__(nodes_key, num_points)
 
-    bezier_vertices = np.array(vertices_to_line_vertices(xyz_to_vertices(bezier_points_xyz)), dtype=np.float32)
 
-    bezier_colors = np.array([[0.5, 0.0, 1.0, 1.0]] * len(bezier_vertices), dtype=np.float32)
+@functools.lru_cache(maxsize=32)
+def tessellate_bezier(bezier_control_nodes, num_points):
+    """Tessellate a bezier curve into vertex, color and index buffers.
 
-    bezier_indices = np.array(range(len(bezier_vertices)), np.uint32)
+    Args:
+        bezier_control_nodes (Tuple): control nodes as a tuple of (x,y,z) tuples, so the result is cacheable
+        num_points (Integer): Number of points to render on the bezier curve
+
+    Returns:
+        List: Vertices (list), colors (list) and indices (list) for the bezier curve
+    """
+    bezier_points = evaluate_bezier_points(bezier_control_nodes, num_points)
+
+    bezier_points_w = np.hstack([bezier_points, np.ones((num_points, 1), dtype=np.float32)])
+
+    bezier_vertices = vertices_to_line_vertices(bezier_points_w)
+
+    bezier_colors = constant_colors([0.5, 0.0, 1.0, 1.0], len(bezier_vertices))
+
+    bezier_indices = np.arange(len(bezier_vertices), dtype=np.uint32)
 
     return bezier_vertices, bezier_colors, bezier_indices
 
 
-def vertices_to_line_vertices(coordinates):
-    """Takes a list of vertices and converts in into a list of vertices so that a continous line is rendered in with GL_LINES
+def evaluate_bezier_points(bezier_control_nodes, num_points):
+    """Evaluate a bezier curve at evenly spaced parameter values.
+
+    Evaluates the Bernstein form of the curve in Horner fashion over all
+    parameter values at once, using two cumulative products over t and 1-t.
+    This is O(num_points * degree) instead of the O(num_points * degree^2)
+    de Casteljau recursion and needs no per-point Python loop.
+
+    Args:
+        bezier_control_nodes (List): control nodes in the format [[x,y,z],[x,y,z],...]
+        num_points (Integer): Number of points to evaluate on the bezier curve
+
+    Returns:
+        np.ndarray: Points on the curve with shape (num_points, 3)
+    """
+    W = np.asarray(bezier_control_nodes, dtype=np.float64)
+    n = len(W) - 1
+
+    t = np.linspace(0.0, 1.0, num_points)
+    u = 1.0 - t
+
+    #closed-form kernels for the quadratic and cubic curves that dominate interactive use
+    if n == 2:
+        points = (u * u)[:, None] * W[0] + (2.0 * u * t)[:, None] * W[1] + (t * t)[:, None] * W[2]
+        return points.astype(np.float32)
+    if n == 3:
+        points = ((u * u * u)[:, None] * W[0] + (3.0 * u * u * t)[:, None] * W[1]
+                  + (3.0 * u * t * t)[:, None] * W[2] + (t * t * t)[:, None] * W[3])
+        return points.astype(np.float32)
+
+    C = binomial_row(n)
+
+    #for large point counts the compiled kernel wins over the broadcasting below
+    if HAS_NUMBA and num_points * (n + 1) > 4096:
+        points = np.empty((num_points, 3), dtype=np.float64)
+        bezier_points_kernel(W, C, t, points)
+        return points.astype(np.float32)
+    T = np.cumprod(np.hstack([np.ones((num_points, 1)), np.repeat(t[:, None], n, axis=1)]), axis=1)
+    U = np.cumprod(np.hstack([np.ones((num_points, 1)), np.repeat(u[:, None], n, axis=1)]), axis=1)
+
+    B = C * T * U[:, ::-1]
+    return (B @ W).astype(np.float32)
+
+
+if HAS_NUMBA:
+    @njit(cache=True, parallel=True, fastmath=True)
+    def bezier_points_kernel(W, C, t, out):
+        """Numba kernel evaluating the Bernstein form in Horner fashion per parameter value.
+
+        Each t value is evaluated in powers of t/(1-t) (or the symmetric
+        ratio for t > 0.5, keeping the recurrence stable) and scaled once
+        by (1-t)^n, writing into the preallocated out array.
+        """
+        n = W.shape[0] - 1
+        for i in prange(t.shape[0]):
+            ti = t[i]
+            ui = 1.0 - ti
+            if ti <= 0.5:
+                s = ti / ui
+                bx = C[n] * W[n, 0]
+                by = C[n] * W[n, 1]
+                bz = C[n] * W[n, 2]
+                for k in range(n - 1, -1, -1):
+                    bx = bx * s + C[k] * W[k, 0]
+                    by = by * s + C[k] * W[k, 1]
+                    bz = bz * s + C[k] * W[k, 2]
+                scale = ui ** n
+            else:
+                s = ui / ti
+                bx = C[0] * W[0, 0]
+                by = C[0] * W[0, 1]
+                bz = C[0] * W[0, 2]
+                for k in range(1, n + 1):
+                    bx = bx * s + C[k] * W[k, 0]
+                    by = by * s + C[k] * W[k, 1]
+                    bz = bz * s + C[k] * W[k, 2]
+                scale = ti ** n
+            out[i, 0] = bx * scale
+            out[i, 1] = by * scale
+            out[i, 2] = bz * scale
+
+    #warm the kernel up once so the first interactive click does not pay the compile
+    bezier_points_kernel(np.zeros((2, 3)), np.ones(2), np.linspace(0.0, 1.0, 2), np.empty((2, 3)))
+
+
+_pascal_rows = [[1]]
+
+
+def binomial_row(n):
+    """Return the binomial coefficients C(n,0)..C(n,n) as a float64 array.
+
+    Rows of Pascal's triangle are grown on demand and kept in a
+    module-level table, so repeated evaluations do an O(1) lookup.
 
     Args:
-        coordinates (List): List of coordinates to convert
+        n (Integer): Degree of the bezier curve
 
     Returns:
-        List: List of vertices for GL_LINES rendering mode
+        np.ndarray: The n-th row of Pascal's triangle
     """
-    vertices = [coordinates[0]]
-    for coord in coordinates[1:-1]:
-        vertices.extend([coord, coord])
-    vertices.append(coordinates[-1])
-    return vertices
+    while len(_pascal_rows) <= n:
+        prev = _pascal_rows[-1]
+        _pascal_rows.append([1] + [prev[i] + prev[i + 1] for i in range(len(prev) - 1)] + [1])
+    return np.asarray(_pascal_rows[n], dtype=np.float64)
 
 
-def separate_coordinates(coordinates):
-    """Takes a list of coordinates and converts it into a different format
+def vertices_to_line_vertices(coordinates):
+    """Takes an array of vertices and duplicates the interior ones so that a continous line is rendered with GL_LINES
 
     Args:
-        coordinates (List): Coordinates in the format [[x,y,z],[x,y,z],...]
+        coordinates (np.ndarray): Array of vertices to convert, one vertex per row
 
     Returns:
-        List: Coordinates in the format [[x,x,x],[y,y,y],[z,z,z]]
+        np.ndarray: Array of vertices for GL_LINES rendering mode
     """
-    x_coordinates = [coord[0] for coord in coordinates]
-    y_coordinates = [coord[1] for coord in coordinates]
-    z_coordinates = [coord[2] for coord in coordinates]
-    return [x_coordinates, y_coordinates, z_coordinates]
+    return np.repeat(np.asarray(coordinates), 2, axis=0)[1:-1]
 
 
-def combine_coordinates(coordinates):
-    """Takes a list of coordinates and converts it into a different format
+def constant_colors(rgba, num_vertices):
+    """Build a color attribute array repeating one rgba color for every vertex.
 
     Args:
-        coordinates (List): Coordinates in the format [[x,x,...],[y,y,...],[z,z,...]] 
+        rgba (List): Color in the format [r,g,b,a]
+        num_vertices (Integer): Number of vertices to color
 
     Returns:
-        List: Coordinates in the format [[x,y,z],[x,y,z],...]
+        np.ndarray: Color array with shape (num_vertices, 4) as float32
     """
-    return [[coord[0], coord[1], coord[2]] for coord in zip(coordinates[0], coordinates[1], coordinates[2])]
+    return np.broadcast_to(np.asarray(rgba, dtype=np.float32), (num_vertices, 4)).copy()
 
 
 def xyz_to_vertices(coords):
@@ -197,16 +351,18 @@ def xyz_to_vertices(coords):
         coords (List): Coordinates in the format [[x,y,z],[x,y,z],...]
 
     Returns:
-        _type_: Vertices in the format [[x,y,z,1.0],[x,y,z,1.0],...]
+        np.ndarray: Vertices in the format [[x,y,z,1.0],[x,y,z,1.0],...] as float32
     """
-    return [coord + [1.0] for coord in coords]
+    coords = np.asarray(coords, dtype=np.float32)
+    return np.concatenate([coords, np.ones((coords.shape[0], 1), dtype=np.float32)], axis=1)
 
 
 def remove_entity_children(entity: Entity):
-    """Remove all children of one entity.
+    """Remove all children of one entity, keeping the first one.
 
     Args:
         entity (Entity): The entity to remove all children from.
     """
-    while entity.getChild(1) is not None:
-        entity.remove(entity.getChild(1))
+    for child in entity._children[1:]:
+        child._parent = None
+    del entity._children[1:]
@@ -17,3 +17,6 @@ class TestEntity(unittest.TestCase):
 
         self.assertEqual(test_render_detail*2-2, len(colors))
         self.assertEqual(test_render_detail*2-2, len(indices))
+
+    def test_no_bezier_package_import(self):
+        self.assertFalse(hasattr(bezier_base, "bezier"))
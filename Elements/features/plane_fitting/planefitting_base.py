@@ -1,7 +1,8 @@
 #### PLANE FITTING ####
 
+import hashlib
+
 import numpy as np
-from skspatial.objects import Plane, Points, Vector
 import imgui
 
 import Elements.pyECSS.math_utilities as util
@@ -14,7 +15,8 @@ from Elements.pyGLV.GL.VertexArray import VertexArray
 from OpenGL.GL import GL_LINES, GL_POINTS, glPointSize
 
 
-input_fitting_nodes = [[0, 0, 0], [1, 0, 0.5], [-1, 0.5, 1], [0.5, 0.5, 0.5], [-1, 1, 0.5], [1, 0.5, -1]]
+input_fitting_nodes = np.array([[0, 0, 0], [1, 0, 0.5], [-1, 0.5, 1], [0.5, 0.5, 0.5], [-1, 1, 0.5], [1, 0.5, -1]],
+                               dtype=np.float32)
 
 
 class PlaneFitting:
@@ -35,6 +37,9 @@ class PlaneFitting:
         self.all_shaders = all_shaders
         self.initUpdate = init_update
 
+        #hash of the fitting nodes the plane was last computed for
+        self.last_fitting_hash = None
+
     def render_gui_and_plane(self):
         """Function to display gui and trigger the fitting of the plane
         """
@@ -43,21 +48,22 @@ class PlaneFitting:
         imgui.begin("Fit Plane")
 
         imgui.text("Fitting nodes X, Y, Z")
-        for i, control_node in enumerate(input_fitting_nodes):
-            changed, input_fitting_nodes[i] = imgui.input_float3(f"Node {i + 1}", *control_node)
+        for i in range(len(input_fitting_nodes)):
+            changed, values = imgui.input_float3(f"Node {i + 1}", *input_fitting_nodes[i])
+            if changed:
+                input_fitting_nodes[i] = values
 
         button_remove_node_pressed = imgui.button("Remove Node")
         imgui.same_line()
         button_add_node_pressed = imgui.button("Add Node")
         if button_remove_node_pressed:
-            input_fitting_nodes.pop()
+            input_fitting_nodes = input_fitting_nodes[:-1]
         if button_add_node_pressed:
-            input_fitting_nodes.append([0.0, 0.0, 0.0])
+            input_fitting_nodes = np.vstack([input_fitting_nodes, np.zeros((1, 3), dtype=np.float32)])
 
         button_planefitting_pressed = imgui.button("Fit Plane")
 
         if button_planefitting_pressed:
-            input_fitting_nodes = [list(tuple) for tuple in input_fitting_nodes]
             self.fit_plane(input_fitting_nodes)
 
         imgui.end()
@@ -69,12 +75,19 @@ class PlaneFitting:
             fitting_nodes (List): fitting nodes for the plane from user input
         """
 
+        #re-clicking with unchanged nodes would redo the whole pipeline for the same plane
+        fitting_hash = hashlib.blake2b(np.ascontiguousarray(fitting_nodes, dtype=np.float64).tobytes(),
+                                       digest_size=8).digest()
+        if fitting_hash == self.last_fitting_hash:
+            return
+        self.last_fitting_hash = fitting_hash
+
         #remove old plane before rendering new one
         remove_entity_children(self.planefitting_entity)
 
-        plane = Plane.best_fit(Points(fitting_nodes))
+        centroid, normal = best_fit_plane(fitting_nodes)
 
-        planefitting_vertices, planefitting_colors, planefitting_indices = generate_planefitting_data(plane, fitting_nodes)
+        planefitting_vertices, planefitting_colors, planefitting_indices = generate_planefitting_data(centroid, normal, fitting_nodes)
 
         # ADD / UPDATE planefitting ##
 
@@ -82,13 +95,13 @@ class PlaneFitting:
                                                      BasicTransform(name="planefitting_trans", trs=util.identity()))
         planefitting_mesh = self.scene.world.addComponent(self.planefitting_entity, RenderMesh(name="planefitting_mesh"))
         planefitting_mesh.vertex_attributes.append(planefitting_vertices)
-        planefitting_mesh.vertex_attributes.append(planefitting_colors)
         planefitting_mesh.vertex_index.append(planefitting_indices)
         planefitting_vArray = self.scene.world.addComponent(self.planefitting_entity,
                                                       VertexArray()) 
 
         planefitting_shader = self.scene.world.addComponent(self.planefitting_entity, ShaderGLDecorator(
-            Shader(vertex_source=Shader.COLOR_VERT_MVP, fragment_source=Shader.COLOR_FRAG)))
+            Shader(vertex_source=Shader.COLOR_VERT_MVP_UNIFORM, fragment_source=Shader.COLOR_FRAG)))
+        planefitting_shader.setUniformVariable("u_color", planefitting_colors[0], float4=True)
         self.all_shaders.append(planefitting_shader)
 
 
@@ -97,26 +110,26 @@ class PlaneFitting:
         projection_lines_entity = self.scene.world.createEntity(Entity(name="projection_lines"))
         self.scene.world.addEntityChild(self.planefitting_entity, projection_lines_entity)
 
-        projection_lines_vertices, projection_lines_colors, projection_lines_indices = generate_projection_lines(plane, fitting_nodes)
+        projection_lines_vertices, projection_lines_colors, projection_lines_indices = generate_projection_lines(centroid, normal, fitting_nodes)
 
         projection_lines_trans = self.scene.world.addComponent(projection_lines_entity,
                                                      BasicTransform(name="projection_lines_trans", trs=util.identity()))
         projection_lines_mesh = self.scene.world.addComponent(projection_lines_entity, RenderMesh(name="projection_lines_mesh"))
         projection_lines_mesh.vertex_attributes.append(projection_lines_vertices)
-        projection_lines_mesh.vertex_attributes.append(projection_lines_colors)
         projection_lines_mesh.vertex_index.append(projection_lines_indices)
         projection_lines_vArray = self.scene.world.addComponent(projection_lines_entity,
                                                       VertexArray(primitive=GL_LINES)) 
 
         projection_lines_shader = self.scene.world.addComponent(projection_lines_entity, ShaderGLDecorator(
-            Shader(vertex_source=Shader.COLOR_VERT_MVP, fragment_source=Shader.COLOR_FRAG))) 
+            Shader(vertex_source=Shader.COLOR_VERT_MVP_UNIFORM, fragment_source=Shader.COLOR_FRAG))) 
+        projection_lines_shader.setUniformVariable("u_color", projection_lines_colors[0], float4=True)
         self.all_shaders.append(projection_lines_shader)
 
 
 
         fitting_nodes_vertices = xyz_to_vertices(fitting_nodes)
-        fitting_nodes_colors = np.array([[0.5, 0.5, 1.0, 1.0]] * len(fitting_nodes_vertices), dtype=np.float32)
-        fitting_nodes_indices = np.array(range(len(fitting_nodes_vertices)), np.uint32)
+        fitting_nodes_colors = constant_colors([0.5, 0.5, 1.0, 1.0], len(fitting_nodes_vertices))
+        fitting_nodes_indices = np.arange(len(fitting_nodes_vertices), dtype=np.uint32)
 
         fitting_nodes = self.scene.world.createEntity(Entity(name="fitting_nodes"))
         self.scene.world.addEntityChild(self.planefitting_entity, fitting_nodes)
@@ -125,45 +138,69 @@ class PlaneFitting:
                                                                            trs=util.identity()))
         fitting_nodes_mesh = self.scene.world.addComponent(fitting_nodes, RenderMesh(name="fitting_nodes_mesh"))
         fitting_nodes_mesh.vertex_attributes.append(fitting_nodes_vertices)
-        fitting_nodes_mesh.vertex_attributes.append(fitting_nodes_colors)
         fitting_nodes_mesh.vertex_index.append(fitting_nodes_indices)
         glPointSize(5)
         fitting_nodes_vArray = self.scene.world.addComponent(fitting_nodes, VertexArray(primitive=GL_POINTS))
 
         fitting_nodes_shader = self.scene.world.addComponent(fitting_nodes, ShaderGLDecorator(
-            Shader(vertex_source=Shader.COLOR_VERT_MVP, fragment_source=Shader.COLOR_FRAG)))
+            Shader(vertex_source=Shader.COLOR_VERT_MVP_UNIFORM, fragment_source=Shader.COLOR_FRAG)))
+        fitting_nodes_shader.setUniformVariable("u_color", fitting_nodes_colors[0], float4=True)
         self.all_shaders.append(fitting_nodes_shader)
 
         self.scene.world.traverse_visit(self.initUpdate, self.scene.world.root)
 
-def generate_projection_lines(plane,fitting_nodes):
+def best_fit_plane(fitting_nodes):
+    """Fit a plane through the fitting nodes in the least squares sense.
+
+    The plane goes through the centroid of the nodes; its normal is the
+    singular vector of the centered nodes with the smallest singular value.
+
+    Args:
+        fitting_nodes (List): List of nodes in the format [[x,y,z],[x,y,z],...]
+
+    Returns:
+        List: Centroid (np.ndarray) and unit normal (np.ndarray) of the fitted plane
+    """
+    nodes = np.asarray(fitting_nodes, dtype=np.float64)
+    centroid = nodes.mean(axis=0)
+    _, _, Vt = np.linalg.svd(nodes - centroid, full_matrices=False)
+    return centroid, Vt[-1]
+
+
+def generate_projection_lines(centroid, normal, fitting_nodes):
     """Generate vertices, colors and indices for the projection lines from the fitting nodes to the plane
 
     Args:
-        plane (skspatial.objects.Plane): Scikit Plane
+        centroid (np.ndarray): A point on the fitted plane
+        normal (np.ndarray): Unit normal of the fitted plane
         fitting_nodes (List): List of nodes to generate projection lines for
 
     Returns:
         List: Vertices (list), colors (list) and indices (list) for the projection lines
     """
-    lines_vertices = []
-    for node in fitting_nodes:
-        lines_vertices.append(node)
-        lines_vertices.append(plane.project_point(node))
+    nodes = np.asarray(fitting_nodes, dtype=np.float64)
+    point = np.asarray(centroid, dtype=np.float64)
 
-    lines_indices = range(len(lines_vertices))
-    lines_color = np.array([[1.0, 1.0, 1.0, 1.0]] * len(lines_vertices), dtype=np.float32)
+    #project all nodes onto the plane at once
+    projections = nodes - ((nodes - point) @ normal)[:, None] * normal
 
-    print(lines_vertices)
+    #interleave each node with its projection for GL_LINES rendering
+    lines_vertices = np.empty((2 * len(nodes), 3), dtype=np.float32)
+    lines_vertices[0::2] = nodes
+    lines_vertices[1::2] = projections
+
+    lines_indices = np.arange(len(lines_vertices), dtype=np.uint32)
+    lines_color = constant_colors([1.0, 1.0, 1.0, 1.0], len(lines_vertices))
 
     return lines_vertices, lines_color, lines_indices
 
 
-def generate_planefitting_data(plane,fitting_nodes):
+def generate_planefitting_data(centroid, normal, fitting_nodes):
     """Generate vertices, colors and indices for the plane
 
     Args:
-        plane (skspatial.objects.Plane): Scikit Plane
+        centroid (np.ndarray): A point on the fitted plane
+        normal (np.ndarray): Unit normal of the fitted plane
         fitting_nodes (List): List of fitting nodes
 
     Returns:
@@ -174,29 +211,24 @@ def generate_planefitting_data(plane,fitting_nodes):
 
     diameter = max(max_x-min_x, max_y-min_y, max_z-min_z)
 
-    global_x = Vector([1.,0.,0.])
-    global_y = Vector([0.,1,0.])
-    plane_x = Vector([0.,0.,0.])
-    plane_y = Vector([0.,0.,0.])
-    normal = plane.normal
+    global_x = np.array([1., 0., 0.])
+    global_y = np.array([0., 1., 0.])
     #if point is not equal to the x axis, use the x axis to get a vector along the plane.
     if(global_x.dot(normal) < 1.-10e-6):
-        plane_x = global_x.cross(normal)
-        plane_y = plane_x.cross(normal)
+        plane_x = np.cross(global_x, normal)
     else:
-        plane_x = global_y.cross(normal)
-        plane_y = plane_x.cross(normal)
+        plane_x = np.cross(global_y, normal)
+    plane_y = np.cross(plane_x, normal)
+
+    point = np.asarray(centroid, dtype=np.float64)
 
-    point = plane.point
+    #corner order: bottom_left, top_left, bottom_right, top_right
+    signs = np.array([[-1, -1], [-1, 1], [1, -1], [1, 1]], dtype=np.float64)
+    corners = point + diameter * (signs @ np.stack([plane_x, plane_y]))
 
-    bottom_left = point - diameter * plane_x - diameter * plane_y
-    top_left    = point - diameter * plane_x + diameter * plane_y
-    bottom_right = point + diameter * plane_x - diameter * plane_y
-    top_right = point + diameter * plane_x + diameter * plane_y
-    
-    planefitting_vertices =  [bottom_left,top_left,bottom_right,top_right]
+    planefitting_vertices = np.hstack([corners.astype(np.float32), np.ones((4, 1), dtype=np.float32)])
     planefitting_indices = [0,1,3,0,3,2]
-    planefitting_colors = np.array([[0.5, 0.0, 1.0, 1.0]] * len(planefitting_vertices), dtype=np.float32)
+    planefitting_colors = constant_colors([0.5, 0.0, 1.0, 1.0], len(planefitting_vertices))
 
     return planefitting_vertices, planefitting_colors, planefitting_indices
 
@@ -211,21 +243,24 @@ def find_boundaries(coordinates):
     Returns:
         List: min x, max x, min y, max y, min z, max z
     """
-    # Initialize min and max values with the first element
-    min_x = max_x = coordinates[0][0]
-    min_y = max_y = coordinates[0][1]
-    min_z = max_z = coordinates[0][2]
-
-    # Iterate over the remaining elements and update min and max values
-    for sublist in coordinates[1:]:
-        min_x = min(min_x, sublist[0])
-        max_x = max(max_x, sublist[0])
-        min_y = min(min_y, sublist[1])
-        max_y = max(max_y, sublist[1])
-        min_z = min(min_z, sublist[2])
-        max_z = max(max_z, sublist[2])
-    
-    return min_x, max_x, min_y, max_y, min_z, max_z
+    coordinates = np.asarray(coordinates, dtype=np.float64)
+    mn = coordinates.min(axis=0)
+    mx = coordinates.max(axis=0)
+
+    return mn[0], mx[0], mn[1], mx[1], mn[2], mx[2]
+
+
+def constant_colors(rgba, num_vertices):
+    """Build a color attribute array repeating one rgba color for every vertex.
+
+    Args:
+        rgba (List): Color in the format [r,g,b,a]
+        num_vertices (Integer): Number of vertices to color
+
+    Returns:
+        np.ndarray: Color array with shape (num_vertices, 4) as float32
+    """
+    return np.broadcast_to(np.asarray(rgba, dtype=np.float32), (num_vertices, 4)).copy()
 
 
 def xyz_to_vertices(coords):
@@ -235,16 +270,18 @@ def xyz_to_vertices(coords):
         coords (List): Coordinates in the format [[x,y,z],[x,y,z],...]
 
     Returns:
-        _type_: Vertices in the format [[x,y,z,1.0],[x,y,z,1.0],...]
+        np.ndarray: Vertices in the format [[x,y,z,1.0],[x,y,z,1.0],...] as float32
     """
-    return [coord + [1.0] for coord in coords]
+    coords = np.asarray(coords, dtype=np.float32)
+    return np.concatenate([coords, np.ones((coords.shape[0], 1), dtype=np.float32)], axis=1)
 
 
 def remove_entity_children(entity: Entity):
-    """Remove all children of one entity.
+    """Remove all children of one entity, keeping the first one.
 
     Args:
         entity (Entity): The entity to remove all children from.
     """
-    while entity.getChild(1) is not None:
-        entity.remove(entity.getChild(1))
+    for child in entity._children[1:]:
+        child._parent = None
+    del entity._children[1:]
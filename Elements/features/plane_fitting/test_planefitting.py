@@ -1,6 +1,5 @@
 import unittest
 import numpy as np
-from skspatial.objects import Plane, Points
 
 import Elements.features.plane_fitting.planefitting_base as planefitting_base
 
@@ -9,9 +8,9 @@ class TestEntity(unittest.TestCase):
 
     def test_generate_projection_lines(self):
         test_fitting_nodes = [[0, 0, 0], [1, 0, 0.5], [-1, 0.5, 1], [0.5, 0.5, 0.5], [-1, 1, 0.5], [1, 0.5, -1]]
-        plane = Plane.best_fit(Points(test_fitting_nodes))
+        centroid, normal = planefitting_base.best_fit_plane(test_fitting_nodes)
 
-        projection_vertices, projection_colors, projection_indices = planefitting_base.generate_projection_lines(plane, test_fitting_nodes)
+        projection_vertices, projection_colors, projection_indices = planefitting_base.generate_projection_lines(centroid, normal, test_fitting_nodes)
 
         self.assertIsNotNone(projection_vertices)
         self.assertIsNotNone(projection_colors)
@@ -24,9 +23,9 @@ class TestEntity(unittest.TestCase):
 
     def test_generate_planefitting_data(self):
         test_fitting_nodes = [[0, 0, 0], [1, 0, 0.5], [-1, 0.5, 1], [0.5, 0.5, 0.5], [-1, 1, 0.5], [1, 0.5, -1]]
-        plane = Plane.best_fit(Points(test_fitting_nodes))
+        centroid, normal = planefitting_base.best_fit_plane(test_fitting_nodes)
 
-        fitting_vertices, fitting_colors, fitting_indices = planefitting_base.generate_planefitting_data(plane, test_fitting_nodes)
+        fitting_vertices, fitting_colors, fitting_indices = planefitting_base.generate_planefitting_data(centroid, normal, test_fitting_nodes)
 
         self.assertIsNotNone(fitting_vertices)
         self.assertIsNotNone(fitting_colors)
@@ -35,4 +34,7 @@ class TestEntity(unittest.TestCase):
         self.assertEqual(len(fitting_vertices), 4)
         self.assertEqual(len(fitting_vertices), len(fitting_colors))
         self.assertEqual(len(fitting_indices), 6)
-        
\ No newline at end of file
+        
+    def test_no_skspatial_import(self):
+        for symbol in ("Plane", "Points", "Vector"):
+            self.assertFalse(hasattr(planefitting_base, symbol))
@@ -1,5 +1,30 @@
+"""2D and 3D function plotting on top of the ECS scene.
+
+Geometry layout: the generators emit one contiguous numpy array per
+vertex attribute (positions, colors, normals), matching VertexArray's
+one-buffer-per-attribute upload path. Attributes deliberately stay in
+separate buffers rather than one interleaved VBO: it keeps position-only
+consumers cheap and lets a re-plot refill a single attribute without
+repacking the others.
+"""
+
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    import numexpr as ne
+    HAS_NUMEXPR = True
+except ImportError:
+    HAS_NUMEXPR = False
+
 import Elements.pyECSS.math_utilities as util
 from Elements.pyECSS.Entity import Entity
 from Elements.pyECSS.Component import BasicTransform, RenderMesh
@@ -10,7 +35,6 @@ from Elements.pyGLV.GUI.Viewer import RenderGLStateSystem
 
 from Elements.pyGLV.GL.Shader import InitGLShaderSystem, Shader, ShaderGLDecorator, RenderGLShaderSystem
 from Elements.pyGLV.GL.VertexArray import VertexArray
-from OpenGL.GL import GL_LINES
 
 import OpenGL.GL as gl
 import imgui
@@ -42,6 +66,17 @@ class FunctionPlotting:
         self.shader_3d = shader_3d
         self.initUpdate = init_update
 
+        #components are created lazily on first render and refilled on re-plot
+        self.plotting2d_mesh = None
+        self.plotting2d_vArray = None
+        self.plotting3d_mesh = None
+        self.plotting3d_vArray = None
+
+        #geometry generation runs off the gui thread; uploads stay on it
+        self.plot_executor = ThreadPoolExecutor(max_workers=1)
+        self.pending_2d_plot = None
+        self.pending_3d_plot = None
+
     def render_gui_and_plots(self):
         """Function to display gui and trigger the plotting and rendering of the 2D and 3D function.
         """
@@ -73,12 +108,24 @@ class FunctionPlotting:
             func_detail = 100
         elif (func_detail < 4):
             func_detail = 4
+        #generation is submitted to the worker so large plots do not stall the
+        #frame; the key is normalized so repeated presses hit the lru cache
         if button_print_2D_pressed:
-            self.render_2d_plot(plot_boundaries, func_detail, f_x)
+            self.pending_2d_plot = self.plot_executor.submit(
+                generate_plot2d_data, tuple(map(float, plot_boundaries)), int(func_detail), f_x)
         if button_print_3D_pressed:
-            self.render_3d_plot(plot_boundaries, func_detail, f_x_y)
+            self.pending_3d_plot = self.plot_executor.submit(
+                generate_plot3d_data, tuple(map(float, plot_boundaries)), int(func_detail), f_x_y)
         imgui.end()
 
+        #poll without blocking; the GL upload must run on the gui thread
+        if self.pending_2d_plot is not None and self.pending_2d_plot.done():
+            pending, self.pending_2d_plot = self.pending_2d_plot, None
+            self.upload_2d_plot(*pending.result())
+        if self.pending_3d_plot is not None and self.pending_3d_plot.done():
+            pending, self.pending_3d_plot = self.pending_3d_plot, None
+            self.upload_3d_plot(*pending.result())
+
     def render_2d_plot(self, plot_boundaries, func_detail, f_x):
         """Function for triggering computing 2D plot data and render the plot into the scene
 
@@ -87,20 +134,41 @@ class FunctionPlotting:
             func_detail (Integer): Number of points to plot on the function from user input
             f_x (String): F(x) function as string representation from user input
         """
-        plotting2d_vertices, plotting2d_colors, plotting2d_indices = generate_plot2d_data(plot_boundaries, func_detail, f_x)
+        #normalize the key so equal gui input always hits the same cache entry
+        self.upload_2d_plot(*generate_plot2d_data(
+            tuple(map(float, plot_boundaries)), int(func_detail), f_x))
+
+    def upload_2d_plot(self, plotting2d_vertices, plotting2d_colors, plotting2d_indices):
+        """Upload generated 2D plot data into the scene; must run on the gui thread.
 
-        ## ADD / UPDATE PLOT 2D ##
+        Args:
+            plotting2d_vertices (np.ndarray): Vertices for the plotted function
+            plotting2d_colors (np.ndarray): Colors for the plotted function
+            plotting2d_indices (np.ndarray): Indices for the plotted function
+        """
+        if self.plotting2d_mesh is not None:
+            ## UPDATE PLOT 2D in place ##
+            #the vArray shares these lists since the init pass, so refilling
+            #them and re-uploading the GL buffers is all a re-plot needs
+            self.plotting2d_mesh.vertex_attributes[0] = plotting2d_vertices
+            self.plotting2d_mesh.vertex_attributes[1] = plotting2d_colors
+            self.plotting2d_mesh.vertex_index[0] = plotting2d_indices
+            self.plotting2d_vArray.updateVertexBuffers()
+            return
+
+        ## ADD PLOT 2D on first render ##
 
         remove_entity_children(self.function2d_entity)
 
         plotting2d_trans = self.scene.world.addComponent(self.function2d_entity,
                                                      BasicTransform(name="plotting2d_trans", trs=util.identity()))
-        plotting2d_mesh = self.scene.world.addComponent(self.function2d_entity, RenderMesh(name="plotting2d_mesh"))
-        plotting2d_mesh.vertex_attributes.append(plotting2d_vertices)
-        plotting2d_mesh.vertex_attributes.append(plotting2d_colors)
-        plotting2d_mesh.vertex_index.append(plotting2d_indices)
-        plotting2d_vArray = self.scene.world.addComponent(self.function2d_entity,
-                                                      VertexArray(primitive=GL_LINES))  # note the primitive change
+        self.plotting2d_mesh = self.scene.world.addComponent(self.function2d_entity, RenderMesh(name="plotting2d_mesh"))
+        self.plotting2d_mesh.vertex_attributes.append(plotting2d_vertices)
+        self.plotting2d_mesh.vertex_attributes.append(plotting2d_colors)
+        self.plotting2d_mesh.vertex_index.append(plotting2d_indices)
+        self.plotting2d_vArray = self.scene.world.addComponent(self.function2d_entity,
+                                                      VertexArray(primitive=gl.GL_LINE_STRIP,  # note the primitive change
+                                                                  usage=gl.GL_DYNAMIC_DRAW))
 
         plotting2d_shader = self.scene.world.addComponent(self.function2d_entity, ShaderGLDecorator(
             Shader(vertex_source=Shader.COLOR_VERT_MVP, fragment_source=Shader.COLOR_FRAG)))
@@ -116,22 +184,44 @@ class FunctionPlotting:
             func_detail (Integer): Number of points to plot on the function from user input
             f_x_y (String): F(x, y) function as string representation from user input
         """
-        
-        plotting3d_vertices, plotting3d_colors, plotting3d_indices, plotting3d_normals = generate_plot3d_data(plot_boundaries, func_detail, f_x_y)
 
-        ## ADD / UPDATE PLOT 3D ##
+        #normalize the key so equal gui input always hits the same cache entry
+        self.upload_3d_plot(*generate_plot3d_data(
+            tuple(map(float, plot_boundaries)), int(func_detail), f_x_y))
+
+    def upload_3d_plot(self, plotting3d_vertices, plotting3d_colors, plotting3d_indices, plotting3d_normals):
+        """Upload generated 3D plot data into the scene; must run on the gui thread.
+
+        Args:
+            plotting3d_vertices (np.ndarray): Vertices for the plotted function
+            plotting3d_colors (np.ndarray): Colors for the plotted function
+            plotting3d_indices (np.ndarray): Indices for the plotted function
+            plotting3d_normals (np.ndarray): Normals for the plotted function
+        """
+        if self.plotting3d_mesh is not None:
+            ## UPDATE PLOT 3D in place ##
+            #the vArray shares these lists since the init pass, so refilling
+            #them and re-uploading the GL buffers is all a re-plot needs
+            self.plotting3d_mesh.vertex_attributes[0] = plotting3d_vertices
+            self.plotting3d_mesh.vertex_attributes[1] = plotting3d_colors
+            self.plotting3d_mesh.vertex_attributes[2] = plotting3d_normals
+            self.plotting3d_mesh.vertex_index[0] = plotting3d_indices
+            self.plotting3d_vArray.updateVertexBuffers()
+            return
+
+        ## ADD PLOT 3D on first render ##
 
         remove_entity_children(self.function3d_entity)
 
         plotting3d_trans = self.scene.world.addComponent(self.function3d_entity,
                                                      BasicTransform(name="plotting3d_trans", trs=util.identity()))
-        plotting3d_mesh = self.scene.world.addComponent(self.function3d_entity, RenderMesh(name="plotting3d_mesh"))
-        plotting3d_mesh.vertex_attributes.append(plotting3d_vertices)
-        plotting3d_mesh.vertex_attributes.append(plotting3d_colors)
-        plotting3d_mesh.vertex_attributes.append(plotting3d_normals)
-        plotting3d_mesh.vertex_index.append(plotting3d_indices)
-        plotting3d_vArray = self.scene.world.addComponent(self.function3d_entity,
-                                                      VertexArray())
+        self.plotting3d_mesh = self.scene.world.addComponent(self.function3d_entity, RenderMesh(name="plotting3d_mesh"))
+        self.plotting3d_mesh.vertex_attributes.append(plotting3d_vertices)
+        self.plotting3d_mesh.vertex_attributes.append(plotting3d_colors)
+        self.plotting3d_mesh.vertex_attributes.append(plotting3d_normals)
+        self.plotting3d_mesh.vertex_index.append(plotting3d_indices)
+        self.plotting3d_vArray = self.scene.world.addComponent(self.function3d_entity,
+                                                      VertexArray(usage=gl.GL_DYNAMIC_DRAW))
 
         plotting3d_shader = self.scene.world.addComponent(self.function3d_entity, ShaderGLDecorator(
             Shader(vertex_source=Shader.VERT_PHONG_MVP, fragment_source=Shader.FRAG_PHONG)))
@@ -139,9 +229,13 @@ class FunctionPlotting:
 
         self.scene.world.traverse_visit(self.initUpdate, self.scene.world.root)
 
+@functools.lru_cache(maxsize=8)
 def generate_plot2d_data(plot_boundaries, func_detail, f_x):
     """Compute x, y value pairs for the given function and generate vertices, colors and indices accordingly.
 
+    Results are memoized per (boundaries, detail, expression), so
+    re-plotting unchanged gui input skips the whole generation.
+
     Args:
         plot_boundaries (List): max X, min X, max Y, min Y boundaries for the function plotting from user input
         func_detail (Integer): Number of points to plot on the function from user input
@@ -150,24 +244,30 @@ def generate_plot2d_data(plot_boundaries, func_detail, f_x):
     Returns:
         List: Vertices (list), colors (list) and indices (list) for the plotted function.
     """
-    x = np.linspace(plot_boundaries[0], plot_boundaries[1], func_detail)
+    x = np.linspace(plot_boundaries[0], plot_boundaries[1], func_detail, dtype=np.float32)
     y = eval_f_x(f_x, x)
-    
-    plotting_vertices = np.empty((0, 4), np.float32)
-    for i in range(0, len(x)-2):
-        point1 = [x[i], y[i], 0.0, 1.0]
-        point2 = [x[i+1], y[i+1], 0.0, 1.0]
-        plotting_vertices = np.append(plotting_vertices, [point1, point2], axis=0)
 
-    plotting_colors = np.array([[0.5, 0.0, 1.0, 1.0]] * len(plotting_vertices), dtype=np.float32)
+    #assemble the polyline straight into a final-size float32 buffer;
+    #positions are packed xyz, the vertex attribute's w defaults to 1.0.
+    #drawn as a GL_LINE_STRIP, so each point appears exactly once
+    plotting_vertices = np.zeros((len(x), 3), dtype=np.float32)
+    plotting_vertices[:, 0] = x
+    plotting_vertices[:, 1] = y
+
+    #constant color: a zero-copy broadcast view is enough until upload time
+    plotting_colors = np.broadcast_to(np.array([0.5, 0.0, 1.0, 1.0], np.float32), (len(plotting_vertices), 4))
 
-    plotting_indices = np.array(range(len(plotting_vertices)), np.uint32)
+    plotting_indices = np.arange(len(plotting_vertices), dtype=np.uint32)
 
     return plotting_vertices, plotting_colors, plotting_indices
 
+@functools.lru_cache(maxsize=8)
 def generate_plot3d_data(plot_boundaries, func_detail, f_x_y):
     """Compute x, y, z values for the given function and generate vertices, colors, indices and normals accordingly.
 
+    Results are memoized per (boundaries, detail, expression), so
+    re-plotting unchanged gui input skips the whole generation.
+
     Args:
         plot_boundaries (List): max X, min X, max Y, min Y boundaries for the function plotting from user input
         func_detail (Integer): Number of points to plot on the function from user input
@@ -176,82 +276,178 @@ def generate_plot3d_data(plot_boundaries, func_detail, f_x_y):
     Returns:
         List: Vertices (list), colors (list), indices (list) and normals (list) for the plotted function.
     """
-    x = np.linspace(plot_boundaries[0], plot_boundaries[1], func_detail)
-    z = np.linspace(plot_boundaries[2], plot_boundaries[3], func_detail)
-
-    triangles_vertices = np.empty((0, 4), np.float32)
-
-    q = 0
-    while (q < len(z) - 1):
-        q += 1
-        l = 0
-        while (l < len(x) - 1):
-            l += 1
-            # first triangle
-            point1 = x[l - 1], eval_f_x_y(f_x_y, x[l - 1], z[q - 1]), z[q - 1], 1
-            point2 = x[l], eval_f_x_y(f_x_y, x[l], z[q - 1]), z[q - 1], 1
-            point3 = x[l], eval_f_x_y(f_x_y, x[l], z[q]), z[q], 1
-
-            triangles_vertices = np.append(triangles_vertices, [point1, point2, point3], axis=0)
-
-            # second triangle
-            point1 = x[l - 1], eval_f_x_y(f_x_y, x[l - 1], z[q - 1]), z[q - 1], 1
-            point2 = x[l], eval_f_x_y(f_x_y, x[l], z[q]), z[q], 1
-            point3 = x[l - 1], eval_f_x_y(f_x_y, x[l - 1], z[q]), z[q], 1
-
-            triangles_vertices = np.append(triangles_vertices, [point1, point2, point3], axis=0)
-
-    triangles_colors = np.array([[0.0, 1.0, 1.0, 1.0]] * len(triangles_vertices), dtype=np.float32)
-    triangles_indices = np.array(range(len(triangles_vertices)), np.uint32)
-
-    triangles_normals = []
-    #create array of normals with size of vertices
-    sumNormals = np.array([(0.,0.,0.)] * len(triangles_vertices))
-    sumCounter = np.array([(0)] * len(triangles_vertices))
-    for i in range(0, len(triangles_indices), 3):
-        #calculate normal for each triangle
-        normal = np.cross(np.subtract(triangles_vertices[triangles_indices[i+1]], triangles_vertices[triangles_indices[i]])[:-1], np.subtract(triangles_vertices[triangles_indices[i+2]], triangles_vertices[triangles_indices[i]])[:-1])
-        #normalize normal
-        normal = normal / np.linalg.norm(normal)
-        #add normal to each vertex of the triangle
-        sumNormals[triangles_indices[i]] += normal
-        sumNormals[triangles_indices[i + 1]] += normal
-        sumNormals[triangles_indices[i + 2]] += normal
-        #increase counter for each vertex of the triangle
-        sumCounter[triangles_indices[i]] += 1
-        sumCounter[triangles_indices[i + 1]] += 1
-        sumCounter[triangles_indices[i + 2]] += 1
-    #iterrate through all triangles and set normals to average normal
-    for i in range(len(sumNormals)):
-        new_normal = sumNormals[i]/sumCounter[i]
-        new_normal = new_normal / np.linalg.norm(new_normal)
-        triangles_normals.append(new_normal)
+    x = np.linspace(plot_boundaries[0], plot_boundaries[1], func_detail, dtype=np.float32)
+    z = np.linspace(plot_boundaries[2], plot_boundaries[3], func_detail, dtype=np.float32)
+
+    #evaluate the function once over the whole grid instead of once per triangle corner
+    X, Z = np.meshgrid(x, z, indexing='xy')
+    Y = eval_f_x_y(f_x_y, X, Z)
+
+    #each grid point becomes exactly one vertex; triangles reference them by index.
+    #write straight into the final-size float32 buffer, no double-precision
+    #intermediate; positions are packed xyz, the attribute's w defaults to 1.0
+    triangles_vertices = np.empty((func_detail * func_detail, 3), dtype=np.float32)
+    triangles_vertices[:, 0] = X.ravel()
+    triangles_vertices[:, 1] = Y.ravel()
+    triangles_vertices[:, 2] = Z.ravel()
+
+    #two triangles per cell, in the same winding as before
+    index_grid = np.arange(func_detail * func_detail, dtype=np.uint32).reshape(func_detail, func_detail)
+    i00 = index_grid[:-1, :-1]
+    i10 = index_grid[:-1, 1:]
+    i11 = index_grid[1:, 1:]
+    i01 = index_grid[1:, :-1]
+    triangles_indices = np.stack([i00, i10, i11, i00, i11, i01], axis=-1).ravel()
+
+    #constant color: a zero-copy broadcast view is enough until upload time
+    triangles_colors = np.broadcast_to(np.array([0.0, 1.0, 1.0, 1.0], np.float32), (len(triangles_vertices), 4))
+
+    triangle_corners = triangles_indices.reshape(-1, 3)
+
+    #for dense grids the compiled kernel beats np.add.at by a wide margin
+    if HAS_NUMBA and len(triangle_corners) > 4096:
+        triangles_normals = np.empty((len(triangles_vertices), 3), dtype=np.float32)
+        plot3d_normals_kernel(triangles_vertices, triangle_corners, triangles_normals)
+        return triangles_vertices, triangles_colors, triangles_indices, triangles_normals
+
+    #face normals for all triangles at once
+    v0 = triangles_vertices[triangle_corners[:, 0], :3]
+    v1 = triangles_vertices[triangle_corners[:, 1], :3]
+    v2 = triangles_vertices[triangle_corners[:, 2], :3]
+    face_normals = np.cross(v1 - v0, v2 - v0)
+    face_normals /= np.linalg.norm(face_normals, axis=1, keepdims=True)
+
+    #scatter-accumulate each face normal onto its three vertices, then normalize the average
+    sumNormals = np.zeros((len(triangles_vertices), 3), dtype=np.float32)
+    np.add.at(sumNormals, triangle_corners.ravel(), np.repeat(face_normals, 3, axis=0))
+    triangles_normals = sumNormals / np.linalg.norm(sumNormals, axis=1, keepdims=True)
 
     return triangles_vertices, triangles_colors, triangles_indices, triangles_normals
 
 
-def summ(x, y):
+if HAS_NUMBA:
+    @njit(cache=True, parallel=True, fastmath=True)
+    def plot3d_normals_kernel(vertices, corners, out):
+        """Numba kernel averaging unit face normals onto the shared vertices.
+
+        Face normals are computed in parallel; the scatter onto the
+        vertices runs serially to stay race free, and the final
+        normalization is again parallel per vertex.
+        """
+        num_faces = corners.shape[0]
+        face_normals = np.empty((num_faces, 3), np.float32)
+        for f in prange(num_faces):
+            a = corners[f, 0]
+            b = corners[f, 1]
+            c = corners[f, 2]
+            e1x = vertices[b, 0] - vertices[a, 0]
+            e1y = vertices[b, 1] - vertices[a, 1]
+            e1z = vertices[b, 2] - vertices[a, 2]
+            e2x = vertices[c, 0] - vertices[a, 0]
+            e2y = vertices[c, 1] - vertices[a, 1]
+            e2z = vertices[c, 2] - vertices[a, 2]
+            nx = e1y * e2z - e1z * e2y
+            ny = e1z * e2x - e1x * e2z
+            nz = e1x * e2y - e1y * e2x
+            length = np.sqrt(nx * nx + ny * ny + nz * nz)
+            face_normals[f, 0] = nx / length
+            face_normals[f, 1] = ny / length
+            face_normals[f, 2] = nz / length
+
+        out[:] = 0.0
+        for f in range(num_faces):
+            for corner in range(3):
+                v = corners[f, corner]
+                out[v, 0] += face_normals[f, 0]
+                out[v, 1] += face_normals[f, 1]
+                out[v, 2] += face_normals[f, 2]
+
+        for v in prange(out.shape[0]):
+            length = np.sqrt(out[v, 0] ** 2 + out[v, 1] ** 2 + out[v, 2] ** 2)
+            out[v, 0] /= length
+            out[v, 1] /= length
+            out[v, 2] /= length
+
+    #warm the kernel up once so the first interactive click does not pay the compile
+    plot3d_normals_kernel(np.zeros((3, 4), dtype=np.float32),
+                          np.array([[0, 1, 2]], dtype=np.uint32),
+                          np.empty((3, 3), dtype=np.float32))
+
+def remove_entity_children(entity: Entity):
+    """Remove all children of one entity, keeping the first one.
+
+    Args:
+        entity (Entity): The entity to remove all children from.
+    """
+    for child in entity._children[1:]:
+        child._parent = None
+    del entity._children[1:]
+
+#names user expressions may reference, resolved once at module import
+_EVAL_GLOBALS = {
+    '__builtins__': {},
+    'sin': np.sin,
+    'cos': np.cos,
+    'tan': np.tan,
+    'pi': np.pi,
+    'e': np.e,
+}
+
+
+@functools.lru_cache(maxsize=32)
+def compile_expression(expression):
+    """Compile a user expression string to a code object.
 
-    result = x + y
+    The gui hands the same expression string over and over; compiling it
+    once and caching the code object avoids re-parsing the source on
+    every evaluation.
 
-    return result
+    Args:
+        expression (String): Function in string representation
 
+    Returns:
+        code: Compiled code object for eval
+    """
+    return compile(expression, '<plot>', 'eval')
 
 
-randosummenergebnis = summ(3, 5)
+@functools.lru_cache(maxsize=32)
+def make_fxy(expression):
+    """Build a callable f(x, y) from a function in string representation.
 
-def remove_entity_children(entity: Entity):
-    """Remove all children of one entity.
+    The returned closure resolves names once at build time and can then
+    be called any number of times (including on whole numpy arrays)
+    without re-entering eval.
 
     Args:
-        entity (Entity): The entity to remove all children from.
+        expression (String): Function in string representation
+
+    Returns:
+        Function: Callable evaluating the expression for given x and y
     """
-    while entity.getChild(1) is not None:
-        entity.remove(entity.getChild(1))
+    return eval(compile_expression(f"lambda x, y: {expression}"), _EVAL_GLOBALS)
+
+
+@functools.lru_cache(maxsize=32)
+def make_fx(expression):
+    """Build a callable f(x) from a function in string representation.
+
+    Args:
+        expression (String): Function in string representation
+
+    Returns:
+        Function: Callable evaluating the expression for given x
+    """
+    return eval(compile_expression(f"lambda x: {expression}"), _EVAL_GLOBALS)
+
 
 def eval_f_x_y(function, x,y):
     """Helper function to compute result for a function in string representation for given x, y values.
 
+    Array inputs go through numexpr when available, which evaluates
+    multi-op expressions elementwise without numpy temporaries; scalar
+    inputs and expressions numexpr cannot handle use the compiled lambda.
+
     Args:
         function (String): Function in string representation
         x (Float): x value
@@ -260,20 +456,18 @@ def eval_f_x_y(function, x,y):
     Returns:
         Float: Result of the function for given x and y
     """
-    d= {}
-    d['x'] = x
-    d['y'] = y
-    d['sin'] = np.sin
-    d['cos'] = np.cos
-    d['tan'] = np.tan
-    d['pi'] = np.pi
-    d['e'] = np.e
-    z = eval(function,d)
-    return z
+    if HAS_NUMEXPR and isinstance(x, np.ndarray):
+        try:
+            return ne.evaluate(function, local_dict={'x': x, 'y': y, 'pi': np.pi, 'e': np.e})
+        except Exception:
+            pass #not every expression maps to numexpr; fall back below
+    return make_fxy(function)(x, y)
 
 def eval_f_x(function, x):
     """Helper function to compute result for a function in string representation for given x values.
 
+    Array inputs go through numexpr when available, see eval_f_x_y.
+
     Args:
         function (String): Function in string representation
         x (Float): x value
@@ -281,12 +475,9 @@ def eval_f_x(function, x):
     Returns:
         Float: Result of the function for given x
     """
-    d= {}
-    d['x'] = x
-    d['sin'] = np.sin
-    d['cos'] = np.cos
-    d['tan'] = np.tan
-    d['pi'] = np.pi
-    d['e'] = np.e
-    y = eval(function,d)
-    return y
\ No newline at end of file
+    if HAS_NUMEXPR and isinstance(x, np.ndarray):
+        try:
+            return ne.evaluate(function, local_dict={'x': x, 'pi': np.pi, 'e': np.e})
+        except Exception:
+            pass #not every expression maps to numexpr; fall back below
+    return make_fx(function)(x)
\ No newline at end of file
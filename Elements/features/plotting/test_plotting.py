@@ -18,7 +18,7 @@ class TestEntity(unittest.TestCase):
         self.assertIsNotNone(plotting2d_colors)
         self.assertIsNotNone(plotting2d_indices)
 
-        self.assertEqual(func_detail*2-4, len(plotting2d_vertices))
+        self.assertEqual(func_detail, len(plotting2d_vertices))
         self.assertEqual(len(plotting2d_vertices), len(plotting2d_colors))
         self.assertEqual(len(plotting2d_vertices), len(plotting2d_indices))
         
@@ -32,6 +32,7 @@ class TestEntity(unittest.TestCase):
         self.assertIsNotNone(plotting3d_indices)
         self.assertIsNotNone(plotting3d_normals)
 
+        self.assertEqual(func_detail**2, len(plotting3d_vertices))
         self.assertEqual(len(plotting3d_vertices), len(plotting3d_colors))
-        self.assertEqual(len(plotting3d_vertices), len(plotting3d_indices))
+        self.assertEqual(6*(func_detail-1)**2, len(plotting3d_indices))
         self.assertEqual(len(plotting3d_vertices), len(plotting3d_normals))
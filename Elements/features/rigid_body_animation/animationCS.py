@@ -77,7 +77,7 @@ class AnimationTransform(BasicTransform):
         #     self._current_frame=100
     def __str__(self):
         np.set_printoptions(formatter={'float': lambda x: "{0:0.3f}".format(x)}) # print only one 3 decimals
-        return f"\n {self.getClassName()} name: {self._name}, type: {self._type}, id: {self._id}, parent: {self._parent._name}"
+        return f"\n {self.getClassName()} name: {self._name}, type: {self._type}, id: {self._id}, parent: {self.parentName()}"
     
     def drawSelfGui(self, imgui):
         imgui.text("WHAT WHAT WHAT")
@@ -274,7 +274,8 @@ class ECSSManager():
                         #print(traversedComp)
                         # accept a visitor System for each Component that can accept it
                         # calls specific concrete Visitor's apply2Component(), which calls specific concrete Component's methods
-                        traversedComp.accept(system)
+                        # routed through the cached (Component type, System type) dispatch
+                        traversedComp._dispatch(system)
 
             toc1 = time.perf_counter()
 
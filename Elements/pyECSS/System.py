@@ -277,7 +277,7 @@ class TransformSystem(System):
 
         l2worldTRS = self.getLocal2World(basicTransform)
         #update l2world of basicTransform
-        basicTransform.update(l2world=l2worldTRS) 
+        basicTransform.l2world = l2worldTRS #direct property set, skips the kwargs dict
 
 
 class CameraSystem(System):
@@ -351,7 +351,7 @@ class CameraSystem(System):
         proj = self._camera.projMat;
 
         l2c = proj @ r2c @ l2w; # Not sure 100% sure why it didnt play for me before
-        basicTransform.update(l2cam=l2c) ;
+        basicTransform.l2cam = l2c #direct property set, skips the kwargs dict
         
     #first this     
     def apply2Camera(self, cam: Elements.pyECSS.Component.Camera):
@@ -334,9 +334,11 @@ class TestBasicTransform(unittest.TestCase):
         
         myTrans = BasicTransform("myTrans", "BasicTransform", "1")
         myIter = iter(myTrans)
-        
+
         self.assertIsInstance(myIter, CompNullIterator)
-        self.assertEqual(next(myIter), None)
+        #a Component has no children: its iterator is exhausted immediately
+        self.assertRaises(StopIteration, next, myIter)
+        self.assertEqual(list(myTrans), [])
         
         print(myTrans)
         print("\nTestBasicTransform:test_BasicTransform_compNullIterator() END")
@@ -365,9 +367,11 @@ class TestRenderMesh(unittest.TestCase):
         
         myMesh = RenderMesh("myTrans", "RenderMesh", "2")
         myIter = iter(myMesh)
-        
+
         self.assertIsInstance(myIter, CompNullIterator)
-        self.assertEqual(next(myIter), None)
+        #a Component has no children: its iterator is exhausted immediately
+        self.assertRaises(StopIteration, next, myIter)
+        self.assertEqual(list(myMesh), [])
         
         print(myMesh)
         print("\nTestRenderMesh:test_RenderMesh_compNullIterator() END")
@@ -21,7 +21,7 @@ import OpenGL.GL as gl
 import numpy as np
 
 import Elements.pyECSS.System
-from Elements.pyECSS.Component import Component, CompNullIterator
+from Elements.pyECSS.Component import Component, CompNullIterator, _NULL_ITER
 import atexit
 
 class VertexArray(Component):
@@ -33,12 +33,11 @@ class VertexArray(Component):
         Initializes a VertexArray class
         """
         super().__init__(name, type, id)
-        
-        
-        self._parent = self
-        
+
+
         self._glid = None
         self._buffers = [] #store all GL buffers
+        self._buffer_capacities = [] #allocated bytes per GL buffer
         self._draw_command = None
         self._arguments = (0,0)
         self._attributes = attributes
@@ -126,12 +125,23 @@ class VertexArray(Component):
             if data is not None and len(data) : #check if it is empty
                 # bind a new VBO, upload it to GPU, declare size and type
                 self._buffers.append(gl.glGenBuffers(1))
-                data = np.array(data, np.float32, copy=False)
+                # a contiguous float32 array passes straight through the buffer
+                # protocol; no-op when the data already is one, and the only
+                # copy for e.g. broadcast color views happens here at upload.
+                # uint8 attributes (e.g. quantized colors) stay uint8 and are
+                # declared normalized, so the shader still sees [0,1] floats
+                if isinstance(data, np.ndarray) and data.dtype == np.uint8:
+                    data = np.ascontiguousarray(data)
+                    gl_type, normalized = gl.GL_UNSIGNED_BYTE, True
+                else:
+                    data = np.ascontiguousarray(data, dtype=np.float32)
+                    gl_type, normalized = gl.GL_FLOAT, False
                 nb_primitives, size = data.shape
                 gl.glEnableVertexAttribArray(loc)
                 gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._buffers[-1])
                 gl.glBufferData(gl.GL_ARRAY_BUFFER, data, self._usage)
-                gl.glVertexAttribPointer(loc, size, gl.GL_FLOAT, False, 0, None)
+                self._buffer_capacities.append(data.nbytes)
+                gl.glVertexAttribPointer(loc, size, gl_type, normalized, 0, None)
            
         
         #optionally create and upload an index buffer for this VBO         
@@ -139,18 +149,68 @@ class VertexArray(Component):
         self._arguments = (0, nb_primitives)
         if self._index is not None and len(self._index): #check if list is empty
             self._buffers += [gl.glGenBuffers(1)]
-            index_buffer = np.array(self._index, np.int32, copy=False)
+            index_buffer = np.ascontiguousarray(self._index, dtype=np.int32)
             gl.glBindBuffer(gl.GL_ELEMENT_ARRAY_BUFFER, self._buffers[-1])
             gl.glBufferData(gl.GL_ELEMENT_ARRAY_BUFFER, index_buffer, self._usage)
+            self._buffer_capacities.append(index_buffer.nbytes)
             self._draw_command = gl.glDrawElements
             self._arguments = (index_buffer.size, gl.GL_UNSIGNED_INT, None)
         
         # cleanup and unbind so no accidental subsequent state update
         gl.glBindVertexArray(0)
         gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
-    
+
+    def updateVertexBuffers(self):
+        """
+        Re-upload the current attributes and optional index array into the
+        GL buffers created by init(), so a VertexArray can be refilled with
+        new data instead of being destroyed and re-initialised.
+        Buffer storage is reused via glBufferSubData while the new data fits
+        and re-allocated with glBufferData when it grew.
+        Assumes init() ran before and that the set of non-empty attributes
+        and the presence of an index array are unchanged since then.
+        """
+        gl.glBindVertexArray(self._glid)
+        nb_primitives, buffer_slot = 0, 0
+
+        for loc, data in enumerate(self._attributes):
+            if data is not None and len(data): #check if it is empty
+                if isinstance(data, np.ndarray) and data.dtype == np.uint8:
+                    data = np.ascontiguousarray(data)
+                    gl_type, normalized = gl.GL_UNSIGNED_BYTE, True
+                else:
+                    data = np.ascontiguousarray(data, dtype=np.float32)
+                    gl_type, normalized = gl.GL_FLOAT, False
+                nb_primitives, size = data.shape
+                gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._buffers[buffer_slot])
+                if data.nbytes <= self._buffer_capacities[buffer_slot]:
+                    gl.glBufferSubData(gl.GL_ARRAY_BUFFER, 0, data.nbytes, data)
+                else:
+                    gl.glBufferData(gl.GL_ARRAY_BUFFER, data, self._usage)
+                    self._buffer_capacities[buffer_slot] = data.nbytes
+                # re-declare size in case the component count changed
+                gl.glVertexAttribPointer(loc, size, gl_type, normalized, 0, None)
+                buffer_slot += 1
+
+        self._draw_command = gl.glDrawArrays
+        self._arguments = (0, nb_primitives)
+        if self._index is not None and len(self._index): #check if list is empty
+            index_buffer = np.ascontiguousarray(self._index, dtype=np.int32)
+            gl.glBindBuffer(gl.GL_ELEMENT_ARRAY_BUFFER, self._buffers[buffer_slot])
+            if index_buffer.nbytes <= self._buffer_capacities[buffer_slot]:
+                gl.glBufferSubData(gl.GL_ELEMENT_ARRAY_BUFFER, 0, index_buffer.nbytes, index_buffer)
+            else:
+                gl.glBufferData(gl.GL_ELEMENT_ARRAY_BUFFER, index_buffer, self._usage)
+                self._buffer_capacities[buffer_slot] = index_buffer.nbytes
+            self._draw_command = gl.glDrawElements
+            self._arguments = (index_buffer.size, gl.GL_UNSIGNED_INT, None)
+
+        # cleanup and unbind so no accidental subsequent state update
+        gl.glBindVertexArray(0)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
+
     def __iter__(self) ->CompNullIterator:
         """ 
         A component does not have children to iterate, thus a NULL iterator
         """
-        return CompNullIterator(self) 
\ No newline at end of file
+        return _NULL_ITER 
\ No newline at end of file
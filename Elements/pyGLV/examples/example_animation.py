@@ -18,8 +18,9 @@ import Elements.pyGLV.utils.normals as norm
 from Elements.pyGLV.utils.terrain import generateTerrain
 from Elements.pyGLV.utils.obj_to_mesh import obj_to_mesh
 
-import Elements.pyECSS.GA.quaternion as quat
+import Elements.features.GA.quaternion as quat
 from gate_module_euclidean import *
+from Elements.features.SkinnedMesh.gate_module import build_weight_matrix, cpu_skin
 from pyassimp import load
 
 # VERT_PHONG_MVP = """
@@ -48,9 +49,6 @@ from pyassimp import load
 #     """
 
 
-def lerp(a, b, t):
-    return (1 - t) * a + t * b
-
 #Light
 Lposition = util.vec(2.0, 5.5, 2.0) #uniform lightpos
 Lambientcolor = util.vec(1.0, 1.0, 1.0) #uniform ambient color
@@ -87,7 +85,7 @@ orthoCam = scene.world.addComponent(entityCam2, Camera(m, "orthoCam","Camera","5
 
 node4 = scene.world.createEntity(Entity(name="Object"))
 scene.world.addEntityChild(rootEntity, node4)
-trans4 = scene.world.addComponent(node4, BasicTransform(name="Object_TRS", trs=util.scale(0.1)@util.translate(0,0,0) ))
+trans4 = scene.world.addComponent(node4, BasicTransform(name="Object_TRS", trs=util.scale(0.1) )) #translate(0,0,0) is the identity; no need to multiply it in
 mesh4 = scene.world.addComponent(node4, RenderMesh(name="Object_mesh"))
 #skin4 = scene.world.addComponent(node4,SkinnedMesh(name="Object_skin"))
 key1 = scene.world.addComponent(node4, Keyframe(name="Object_key_1"))
@@ -124,12 +122,18 @@ b = mesh.bones
 vw = vertex_weight(len(v))
 vw.populate(b)
 
-v2 = np.concatenate((v, np.ones((v.shape[0], 1))), axis=1)
+#homogeneous positions written straight into one float32 (V,4) buffer;
+#np.concatenate would build the ones column and a float64 temporary first
+v2 = np.empty((v.shape[0], 4), dtype=np.float32)
+v2[:, :3] = v
+v2[:, 3] = 1.0
 
 length = len(v2)
-c = np.random.rand(length, 3)
-c = np.around(c, decimals=1)
-c = np.concatenate((c, np.ones((length, 1))), axis=1)
+#random vertex colors quantized to RGBA uint8: 4 B/vertex instead of 16,
+#uploaded as normalized GL_UNSIGNED_BYTE so the shader still reads [0,1]
+c = np.empty((length, 4), dtype=np.uint8)
+c[:, :3] = np.around(np.random.rand(length, 3), decimals=1) * 255
+c[:, 3] = 255
 
 f2 = f.flatten()
 
@@ -145,26 +149,40 @@ M[1][0:3,0:3] = eulerAnglesToRotationMatrix([0.3,0.3,0.4])
 M[1][0:3,3] = [0.5,0.5,0.5]
 key2.array_MM.append(read_tree(scene2,mesh_id,M,transform))
 
-BB = [b[i].offsetmatrix for i in range(len(b))]
-newv = np.zeros([(len(v)),3])
+#bind-pose offset matrices as one contiguous (N,4,4) float32 block, so
+#the batched palette matmul below reads a single buffer instead of a
+#Python list of small per-bone arrays
+BB = np.stack([b[i].offsetmatrix for i in range(len(b))]).astype(np.float32, copy=False)
 
 alpha = 1
-MM1=[]
 
-for i in range(len(key1.rotate)):
-    MM1.append(np.eye(4))
+#batched keyframe interpolation: all bone quaternions, slerps and
+#translation lerps as whole-array ops instead of a per-bone Python loop;
+#stacked once as contiguous float32 so each frame is a few ufunc calls
+q_1 = np.ascontiguousarray(key1.rotate, dtype=np.float32)
+t_1 = np.ascontiguousarray(key1.translate, dtype=np.float32)
+q_2 = np.ascontiguousarray(key2.rotate, dtype=np.float32)
+t_2 = np.ascontiguousarray(key2.translate, dtype=np.float32)
+
+#bone count bound once; the palette, offsets and keyframes must agree on it
+N = len(BB)
+assert N == len(q_1) == len(q_2)
+
+#one persistent (N,4,4) float32 palette buffer, allocated once and
+#refilled in place: row 3 stays identity, only the slices below change
+MM1 = np.tile(np.eye(4, dtype=np.float32), (N, 1, 1))
+quat.slerp_to_palette(q_1, q_2, t_1, t_2, alpha, MM1)
 
-for i in range(len(key1.rotate)):
-    MM1[i][:3, :3] = quat.Quaternion.to_rotation_matrix(quat.quaternion_slerp(key1.rotate[i], key2.rotate[i], alpha))
-    MM1[i][:3, 3] = lerp(key1.translate[i], key2.translate[i], alpha)
 
+#combine animation and offset matrices once per bone with one batched
+#matmul, instead of re-multiplying the same 4x4 pair for every vertex
+#that references the bone
+P = np.matmul(MM1, BB)
 
-for i in range(len(v)):
-    for j in range(4):
-        if vw.id[i][j] >=0:
-            #mat = key2.array_MM[0][vw.id[i][j]] @ BB[vw.id[i][j]]     
-            mat = MM1[vw.id[i][j]] @ BB[vw.id[i][j]]       
-            newv[i] = newv[i] +  vw.weight[i][j]*(vertex_apply_M(v[i],mat))
+#batched CPU skinning: one palette matmul over all vertices plus a sparse
+#weight blend, replacing the per-vertex/per-weight Python loop
+W = build_weight_matrix(vw, N, len(v))
+newv = cpu_skin(P, v2, W)
 
 print(vw.id)
 #mesh4.vertex_attributes[0] = np.concatenate((newv, np.ones((newv.shape[0], 1))), axis=1)
@@ -172,10 +190,19 @@ print(vw.id)
 normals = norm.generateNormals(v2 , f2)
 
 mesh4.vertex_attributes.append(v2)
-mesh4.vertex_attributes[0] = np.concatenate((newv, np.ones((newv.shape[0], 1))), axis=1)
+skinned = np.empty((newv.shape[0], 4), dtype=np.float32)
+skinned[:, :3] = newv
+skinned[:, 3] = 1.0
+mesh4.vertex_attributes[0] = skinned
 mesh4.vertex_attributes.append(c)
 mesh4.vertex_attributes.append(normals)
-mesh4.vertex_attributes.append(vw.weight)
+#bone weights quantized to normalized uint8 for upload (4 B per vertex
+#instead of 32); rounding error folded into each row's largest weight so
+#the weights still sum to exactly 255 (= 1.0 after GL normalization)
+w8 = np.round(vw.weight * 255).astype(np.int32)
+has_weights = w8.sum(axis=1) > 0
+w8[np.arange(len(w8)), w8.argmax(axis=1)] += np.where(has_weights, 255 - w8.sum(axis=1), 0)
+mesh4.vertex_attributes.append(w8.astype(np.uint8))
 mesh4.vertex_index.append(f2)
 vArray4 = scene.world.addComponent(node4, VertexArray())
 shaderDec4 = scene.world.addComponent(node4, ShaderGLDecorator(Shader(vertex_source = Shader.VERT_PHONG_MVP, fragment_source=Shader.FRAG_PHONG)))
@@ -256,7 +283,17 @@ gWindow._myCamera = view # otherwise, an imgui slider must be moved to properly
 
 model_terrain_axes = util.translate(0.0,0.0,0.0)
 
-
+#static light/material uniforms: set once before the loop; the stored
+#values persist on the shader component, so re-setting them per frame
+#only churned the uniform dicts with the same constants
+shaderDec4.setUniformVariable(key='ambientColor', value=Lambientcolor, float3=True)
+shaderDec4.setUniformVariable(key='ambientStr', value=Lambientstr, float1=True)
+shaderDec4.setUniformVariable(key='viewPos', value=LviewPos, float3=True)
+shaderDec4.setUniformVariable(key='lightPos', value=Lposition, float3=True)
+shaderDec4.setUniformVariable(key='lightColor', value=Lcolor, float3=True)
+shaderDec4.setUniformVariable(key='lightIntensity', value=Lintensity, float1=True)
+shaderDec4.setUniformVariable(key='shininess', value=Mshininess, float1=True)
+shaderDec4.setUniformVariable(key='matColor', value=Mcolor, float3=True)
 
 while running:
     running = scene.render(running)
@@ -265,32 +302,13 @@ while running:
     scene.world.traverse_visit(camUpdate, scene.world.root)
     view =  gWindow._myCamera # updates view via the imgui
 
-    mvp_obj = projMat @ view @ trans4.trs
-    mvp_terrain = projMat @ view @ terrain_trans.trs
-    mvp_axes = projMat @ view @ axes_trans.trs
-
-    
-    # mvp_cube = projMat @ view @ model_cube
-    # if alpha > 1:
-    #     alpha = 0
-
-    # MM1 = []
-    # for i in range(len(key1.rotate)):
-    #     MM1.append(np.eye(4))
-
-    # for i in range(len(key1.rotate)):
-    #     MM1[i][:3, :3] = quat.Quaternion.to_rotation_matrix(quat.quaternion_slerp(key1.rotate[i], key2.rotate[i], alpha))
-    #     MM1[i][:3, 3] = lerp(key1.translate[i], key2.translate[i], alpha)
+    #one view-projection product per frame, then a single batched matmul
+    #over the stacked entity transforms instead of three chained products
+    vp = projMat @ view
+    mvp_obj, mvp_terrain, mvp_axes = vp @ np.stack((trans4.trs, terrain_trans.trs, axes_trans.trs))
 
 
-    # for i in range(len(v)):
-    #     for j in range(4):
-    #         if vw.id[i][j] >=0:
-    #             #mat = key2.array_MM[0][vw.id[i][j]] @ BB[vw.id[i][j]]     
-    #             mat = MM1[vw.id[i][j]] @ BB[vw.id[i][j]]       
-    #             #newv[i] = newv[i] + vw.weight[i][j]*(vertex_apply_M(v[i],mat))
-                 
-    # alpha += 0.05 
+    # mvp_cube = projMat @ view @ model_cube
 
     axes_shader.setUniformVariable(key='modelViewProj', value = mvp_axes, mat4=True)
     terrain_shader.setUniformVariable(key='modelViewProj', value=mvp_terrain, mat4=True)
@@ -300,15 +318,15 @@ while running:
     shaderDec4.setUniformVariable(key='model', value=trans4.trs, mat4=True)
     # shaderDec4.setUniformVariable(key='MM', value=mat, mat4=True)
 
-    shaderDec4.setUniformVariable(key='ambientColor', value=Lambientcolor, float3=True)
-    shaderDec4.setUniformVariable(key='ambientStr', value=Lambientstr, float1=True)
-    shaderDec4.setUniformVariable(key='viewPos', value=LviewPos, float3=True)
-    shaderDec4.setUniformVariable(key='lightPos', value=Lposition, float3=True)
-    shaderDec4.setUniformVariable(key='lightColor', value=Lcolor, float3=True)
-    shaderDec4.setUniformVariable(key='lightIntensity', value=Lintensity, float1=True)
-    shaderDec4.setUniformVariable(key='shininess', value=Mshininess, float1=True)
-    shaderDec4.setUniformVariable(key='matColor', value=Mcolor, float3=True)
-
     scene.render_post()
-    
+
+    # next frame's animation, computed after the draw is submitted so the
+    # CPU slerp/skinning work overlaps the GPU finishing this frame; the
+    # results are consumed at the top of the next iteration
+    # alpha = (frame * 0.05) % 1.0  #branchless playhead (ping-pong: 1-abs(frame*0.05%2 - 1))
+    # frame += 1
+    # quat.slerp_to_palette(q_1, q_2, t_1, t_2, alpha, MM1)  #refill the persistent palette
+    # P = np.matmul(MM1, BB)  #one batched gemm per frame, N matrices
+    # newv = cpu_skin(P, v2, W)  #then refill the position VBO with newv
+
 scene.shutdown()
\ No newline at end of file
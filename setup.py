@@ -41,8 +41,6 @@ setup(
         'ipykernel',
         'usd-core',
         'jupyter',
-        'scikit-spatial',
-        'bezier',
         'clifford',
         'trimesh',
         'pyganja',